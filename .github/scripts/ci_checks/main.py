@@ -1,5 +1,6 @@
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Import validation utilities from common module
@@ -26,20 +27,28 @@ def main():
     all_files_valid = True
     failed_files = []
 
-    for i, file_path in enumerate(all_files, 1):
-        # Convert to relative path for cleaner output
-        relative_path = os.path.relpath(file_path, repo_root)
+    # Files are independent, so validate them across all available cores.
+    # map() keeps results in input order so the output stays deterministic.
+    max_workers = os.cpu_count() or 1
+    chunksize = max(1, len(all_files) // (max_workers * 4))
 
-        logger.progress(i, len(all_files), os.path.basename(relative_path))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(validate_file, all_files, chunksize=chunksize)
 
-        is_valid, message = validate_file(file_path)
+        for i, (file_path, (is_valid, message)) in enumerate(
+            zip(all_files, results), 1
+        ):
+            # Convert to relative path for cleaner output
+            relative_path = os.path.relpath(file_path, repo_root)
 
-        if is_valid:
-            logger.file_status(relative_path, "valid", message)
-        else:
-            logger.file_status(relative_path, "invalid", message)
-            all_files_valid = False
-            failed_files.append(relative_path)
+            logger.progress(i, len(all_files), os.path.basename(relative_path))
+
+            if is_valid:
+                logger.file_status(relative_path, "valid", message)
+            else:
+                logger.file_status(relative_path, "invalid", message)
+                all_files_valid = False
+                failed_files.append(relative_path)
 
     # Print summary
     passed_count = len(all_files) - len(failed_files)
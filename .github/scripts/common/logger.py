@@ -1,3 +1,4 @@
+import shutil
 import sys
 import time
 from typing import Optional
@@ -43,44 +44,73 @@ class Colors:
 class Logger:
     """Enhanced logger with colorful output and formatting"""
     
+    # Number of progress updates between terminal size lookups
+    TERMINAL_SIZE_REFRESH_INTERVAL = 100
+    # Minimum seconds between progress bar redraws (the final update is always drawn)
+    PROGRESS_REFRESH_INTERVAL = 0.1
+    
     def __init__(self, enable_colors: bool = True):
-        self.enable_colors = enable_colors and sys.stdout.isatty()
+        self.is_tty = sys.stdout.isatty()
+        self.enable_colors = enable_colors and self.is_tty
         if not self.enable_colors:
             Colors.disable()
+        self._terminal_width = 0
+        self._progress_calls = 0
+        self._last_progress_time = 0.0
+        self._timestamp_cache = (0, "")
+        
+        # Level markers are fixed once colors are configured, so build them once
+        self._markers = {
+            "info": f"{Colors.CYAN}ℹ{Colors.RESET} ",
+            "success": f"{Colors.GREEN}✓{Colors.RESET} ",
+            "warning": f"{Colors.YELLOW}⚠{Colors.RESET} ",
+            "error": f"{Colors.RED}✗{Colors.RESET} ",
+            "critical": f"{Colors.RED}{Colors.BOLD}🚨 CRITICAL:{Colors.RESET}",
+        }
+        self._format_line = (
+            self._format_line_colored if self.enable_colors else self._format_line_plain
+        )
     
     def _format_timestamp(self) -> str:
-        """Get formatted timestamp"""
-        return time.strftime("%H:%M:%S")
+        """Get formatted timestamp, reformatting at most once per second"""
+        now = int(time.time())
+        cached_second, cached_timestamp = self._timestamp_cache
+        if cached_second == now:
+            return cached_timestamp
+        timestamp = time.strftime("%H:%M:%S", time.localtime(now))
+        self._timestamp_cache = (now, timestamp)
+        return timestamp
+    
+    def _format_line_colored(self, marker: str, message: str, prefix: Optional[str]) -> str:
+        """Build a colored log line"""
+        timestamp = f"{Colors.DIM}[{self._format_timestamp()}]{Colors.RESET}"
+        prefix_str = f" {Colors.BLUE}[{prefix}]{Colors.RESET}" if prefix else ""
+        return f"{timestamp}{prefix_str} {marker} {message}"
+    
+    def _format_line_plain(self, marker: str, message: str, prefix: Optional[str]) -> str:
+        """Build a plain log line, skipping the empty color placeholders"""
+        prefix_str = f" [{prefix}]" if prefix else ""
+        return f"[{self._format_timestamp()}]{prefix_str} {marker} {message}"
     
     def info(self, message: str, prefix: Optional[str] = None):
         """Log an info message"""
-        timestamp = f"{Colors.DIM}[{self._format_timestamp()}]{Colors.RESET}"
-        prefix_str = f" {Colors.BLUE}[{prefix}]{Colors.RESET}" if prefix else ""
-        print(f"{timestamp}{prefix_str} {Colors.CYAN}ℹ{Colors.RESET}  {message}")
+        print(self._format_line(self._markers["info"], message, prefix))
     
     def success(self, message: str, prefix: Optional[str] = None):
         """Log a success message"""
-        timestamp = f"{Colors.DIM}[{self._format_timestamp()}]{Colors.RESET}"
-        prefix_str = f" {Colors.BLUE}[{prefix}]{Colors.RESET}" if prefix else ""
-        print(f"{timestamp}{prefix_str} {Colors.GREEN}✓{Colors.RESET}  {message}")
+        print(self._format_line(self._markers["success"], message, prefix))
     
     def warning(self, message: str, prefix: Optional[str] = None):
         """Log a warning message"""
-        timestamp = f"{Colors.DIM}[{self._format_timestamp()}]{Colors.RESET}"
-        prefix_str = f" {Colors.BLUE}[{prefix}]{Colors.RESET}" if prefix else ""
-        print(f"{timestamp}{prefix_str} {Colors.YELLOW}⚠{Colors.RESET}  {message}")
+        print(self._format_line(self._markers["warning"], message, prefix))
     
     def error(self, message: str, prefix: Optional[str] = None):
         """Log an error message"""
-        timestamp = f"{Colors.DIM}[{self._format_timestamp()}]{Colors.RESET}"
-        prefix_str = f" {Colors.BLUE}[{prefix}]{Colors.RESET}" if prefix else ""
-        print(f"{timestamp}{prefix_str} {Colors.RED}✗{Colors.RESET}  {message}")
+        print(self._format_line(self._markers["error"], message, prefix))
     
     def critical(self, message: str, prefix: Optional[str] = None):
         """Log a critical message"""
-        timestamp = f"{Colors.DIM}[{self._format_timestamp()}]{Colors.RESET}"
-        prefix_str = f" {Colors.BLUE}[{prefix}]{Colors.RESET}" if prefix else ""
-        print(f"{timestamp}{prefix_str} {Colors.RED}{Colors.BOLD}🚨 CRITICAL:{Colors.RESET} {message}")
+        print(self._format_line(self._markers["critical"], message, prefix))
     
     def section(self, title: str):
         """Print a section header"""
@@ -112,19 +142,32 @@ class Logger:
         formatted_path = f"{Colors.DIM}└─{Colors.RESET} {Colors.BRIGHT_WHITE}{file_path}{Colors.RESET}"
         formatted_message = f"   {icon} {status_color}{message}{Colors.RESET}"
         
-        print(formatted_path)
-        print(formatted_message)
+        sys.stdout.write(f"{formatted_path}\n{formatted_message}\n")
     
     def progress(self, current: int, total: int, item: str):
         """Show progress with a progress indicator"""
-        import shutil
+        if not self.is_tty:
+            # A redrawn progress bar is useless in CI logs, only report completion
+            if current == total:
+                print(f"Progress: {current}/{total}")
+            return
+        
+        # Redrawing on every item is wasted work when items complete faster than the eye can see
+        now = time.monotonic()
+        if current != total and now - self._last_progress_time < self.PROGRESS_REFRESH_INTERVAL:
+            return
+        self._last_progress_time = now
+        
         percentage = (current / total) * 100
         bar_length = 30
         filled_length = int(bar_length * current // total)
         bar = '█' * filled_length + '░' * (bar_length - filled_length)
         
-        # Get terminal width and calculate max item length
-        terminal_width = shutil.get_terminal_size().columns
+        # Get terminal width (refreshed periodically) and calculate max item length
+        if self._progress_calls % self.TERMINAL_SIZE_REFRESH_INTERVAL == 0:
+            self._terminal_width = shutil.get_terminal_size().columns
+        self._progress_calls += 1
+        terminal_width = self._terminal_width
         progress_prefix = f"Progress: [{bar}] {current}/{total} ({percentage:.1f}%) - "
         max_item_length = terminal_width - len(progress_prefix) - 10  # 10 chars buffer
         
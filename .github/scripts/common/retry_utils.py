@@ -26,23 +26,19 @@ def retry_with_exponential_backoff(
     """
 
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        # A single attempt needs no retry harness at all
+        if max_retries <= 1:
+            return func
+
+        # Backoff delays only depend on the attempt number, compute them once
+        delays = [base_delay * (1 << attempt) for attempt in range(max_retries - 1)]
+
         @wraps(func)
         def wrapper(*args, **kwargs) -> T:
-            last_exception = None
-
-            for attempt in range(max_retries):
+            for attempt, delay in enumerate(delays):
                 try:
                     return func(*args, **kwargs)
                 except Exception as e:
-                    last_exception = e
-
-                    if attempt == max_retries - 1:
-                        # Last attempt failed, raise the exception
-                        raise
-
-                    # Calculate exponential backoff delay
-                    delay = base_delay * (2**attempt)
-
                     if logger:
                         logger.warning(
                             f"Attempt {attempt + 1}/{max_retries} failed for {func.__name__}: {str(e)}. "
@@ -51,8 +47,8 @@ def retry_with_exponential_backoff(
 
                     time.sleep(delay)
 
-            # This should never be reached, but just in case
-            raise last_exception
+            # Last attempt, let any exception propagate
+            return func(*args, **kwargs)
 
         return wrapper
 
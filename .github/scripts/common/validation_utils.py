@@ -1,18 +1,28 @@
 import os
-import json
 import re
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
 
-VALID_REGISTRIES = [
-    "npm",
-    "py_pi",
-    "crates_io",
-    "golang_proxy",
-    "github_releases",
-    "terraform",
-    "ruby_gems",
-]
-REQUIRED_REGISTRIES = [
+# Both parsers raise ValueError subclasses for malformed JSON and invalid UTF-8
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+VALID_REGISTRIES = frozenset(
+    {
+        "npm",
+        "py_pi",
+        "crates_io",
+        "golang_proxy",
+        "github_releases",
+        "terraform",
+        "ruby_gems",
+    }
+)
+# Ordered for deterministic error reporting; use REQUIRED_REGISTRIES for lookups
+REQUIRED_REGISTRIES_ORDERED = (
     "github_releases",
     "golang_proxy",
     "py_pi",
@@ -20,16 +30,20 @@ REQUIRED_REGISTRIES = [
     "crates_io",
     "terraform",
     "ruby_gems",
-]
-TIMESTAMP_PATTERN = r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z$"
-VERSION_PATTERN = r"^\d+\.\d+(\.\d+)?$"
+)
+REQUIRED_REGISTRIES = frozenset(REQUIRED_REGISTRIES_ORDERED)
+TIMESTAMP_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z$")
+VALIDATION_FILE_NAMES = {"config.json", "index.json", "versions.json"}
+SKIPPED_DIRECTORIES = {".git", "node_modules", ".venv", "__pycache__"}
+# Stop cross-validating versions.json at the first error when CI_FAIL_FAST=1
+FAIL_FAST = os.environ.get("CI_FAIL_FAST") == "1"
 
 
 def validate_config_json(_, content):
     """Validate a config.json file according to the README format."""
     try:
-        data = json.loads(content)
-    except json.JSONDecodeError as e:
+        data = json_loads(content)
+    except ValueError as e:
         return False, f"Invalid JSON: {e}"
 
     # Check required fields
@@ -53,7 +67,7 @@ def validate_config_json(_, content):
     if data["registry"] not in VALID_REGISTRIES:
         return (
             False,
-            f"Invalid registry '{data['registry']}'. Must be one of {VALID_REGISTRIES}",
+            f"Invalid registry '{data['registry']}'. Must be one of {sorted(VALID_REGISTRIES)}",
         )
 
     # Validate field types
@@ -72,7 +86,7 @@ def validate_config_json(_, content):
             return False, f"{field_name} must be a {type_description}"
 
     # Validate timestamp format (RFC 3339/ISO 8601)
-    if not re.match(TIMESTAMP_PATTERN, data["sentinel_timestamp"]):
+    if not TIMESTAMP_PATTERN.match(data["sentinel_timestamp"]):
         return (
             False,
             "sentinel_timestamp must be in RFC 3339/ISO 8601 format (YYYY-MM-DDTHH:MM:SSZ)",
@@ -84,8 +98,8 @@ def validate_config_json(_, content):
 def validate_index_json(file_path, content):
     """Validate the index.json file."""
     try:
-        data = json.loads(content)
-    except json.JSONDecodeError as e:
+        data = json_loads(content)
+    except ValueError as e:
         return False, f"Invalid JSON: {e}"
 
     # Check required structure
@@ -97,63 +111,80 @@ def validate_index_json(file_path, content):
         return False, "'packages' must be an array"
 
     # Check for duplicate packages
-    if len(packages) != len(set(packages)):
-        duplicates = [pkg for pkg in set(packages) if packages.count(pkg) > 1]
+    package_counts = Counter(packages)
+    if len(package_counts) != len(packages):
+        duplicates = [pkg for pkg, count in package_counts.items() if count > 1]
         return False, f"Found duplicate packages: {duplicates}"
 
     # Validate each package
-    base_path = Path(file_path).parent
+    base_path = os.path.dirname(file_path)
     for package in packages:
         if not isinstance(package, str):
             return False, f"Package '{package}' must be a string"
 
         # Verify package path exists
-        package_path = base_path / package
-        if not package_path.exists():
+        if not path_exists(base_path, package):
             return False, f"Package path '{package}' does not exist"
 
     return True, "Valid index.json"
 
 
-def validate_versions_json(file_path, content):
-    """Validate the versions.json file."""
+@lru_cache(maxsize=None)
+def list_directory_entries(dir_path):
+    """List entry names in a directory, scanning each directory only once."""
     try:
-        data = json.loads(content)
-    except json.JSONDecodeError as e:
-        return False, f"Invalid JSON: {e}"
+        with os.scandir(dir_path) as entries:
+            return frozenset(entry.name for entry in entries)
+    except OSError:
+        return frozenset()
 
-    # Check required structure
-    if "versions" not in data:
-        return False, "Missing required key 'versions'"
 
-    versions = data["versions"]
-    if not isinstance(versions, dict):
-        return False, "'versions' must be an object"
+def path_exists(base_path, relative_path):
+    """Check whether a path exists using the cached listing of its parent."""
+    parent, name = os.path.split(os.path.normpath(relative_path))
+    return name in list_directory_entries(os.path.join(base_path, parent))
 
-    # Validate required registries exist
-    for registry in REQUIRED_REGISTRIES:
-        if registry not in versions:
-            return False, f"Missing required registry: {registry}"
-        if not isinstance(versions[registry], dict):
-            return False, f"Registry '{registry}' must be an object"
+
+def validate_versions_json(file_path, content, fail_fast=FAIL_FAST):
+    """Validate the versions.json file.
+
+    Checks run cheapest first: JSON structure, then package entries against
+    index.json, and only then the filesystem lookups for each config.json.
+    With fail_fast, stop at the first error instead of collecting all of them.
+    """
+    versions, error = parse_versions_json(content)
+    if error:
+        return False, error
 
     # Load and validate index.json for cross-validation
-    base_path = Path(file_path).parent
+    base_path = os.path.dirname(file_path)
     index_packages = load_index_packages(base_path)
     if index_packages is None:
         return False, "index.json not found or invalid for cross-validation"
 
-    # Collect all validation errors
-    errors = []
+    registries = [
+        (registry, packages)
+        for registry, packages in versions.items()
+        if registry in REQUIRED_REGISTRIES
+    ]
 
     # Validate each registry's packages and versions
-    for registry, packages in versions.items():
-        if registry not in REQUIRED_REGISTRIES:
-            continue
-
+    errors = []
+    for registry, packages in registries:
         errors.extend(
-            validate_registry_packages(registry, packages, base_path, index_packages)
+            validate_registry_packages(registry, packages, index_packages, fail_fast)
         )
+        if fail_fast and errors:
+            break
+
+    # Only hit the filesystem once every package entry is well-formed
+    if not errors:
+        for registry, packages in registries:
+            errors.extend(
+                validate_registry_configs(registry, packages, base_path, fail_fast)
+            )
+            if fail_fast and errors:
+                break
 
     if errors:
         return False, f"Found {len(errors)} validation errors:\n" + "\n".join(
@@ -163,27 +194,59 @@ def validate_versions_json(file_path, content):
     return True, "Valid versions.json"
 
 
+def parse_versions_json(content):
+    """Parse versions.json and check its structure, returning (versions, error)."""
+    try:
+        data = json_loads(content)
+    except ValueError as e:
+        return None, f"Invalid JSON: {e}"
+
+    # Check required structure
+    if "versions" not in data:
+        return None, "Missing required key 'versions'"
+
+    versions = data["versions"]
+    if not isinstance(versions, dict):
+        return None, "'versions' must be an object"
+
+    # Validate required registries exist
+    for registry in REQUIRED_REGISTRIES_ORDERED:
+        if registry not in versions:
+            return None, f"Missing required registry: {registry}"
+        if not isinstance(versions[registry], dict):
+            return None, f"Registry '{registry}' must be an object"
+
+    return versions, None
+
+
+@lru_cache(maxsize=None)
 def load_index_packages(base_path):
-    """Load and validate index.json, returning set of packages or None if invalid."""
-    index_path = base_path / "index.json"
-    if not index_path.exists():
+    """Load and validate index.json, returning frozenset of packages or None if invalid.
+
+    Cached per base path so index.json is parsed once per run.
+    """
+    index_path = os.path.join(base_path, "index.json")
+    if not os.path.exists(index_path):
         return None
 
     try:
-        with open(index_path, "r", encoding="utf-8") as f:
-            index_data = json.loads(f.read())
+        with open(index_path, "rb") as f:
+            index_data = json_loads(f.read())
             if "packages" not in index_data:
                 return None
-            return set(index_data["packages"])
+            return frozenset(index_data["packages"])
     except Exception:
         return None
 
 
-def validate_registry_packages(registry, packages, base_path, index_packages):
+def validate_registry_packages(registry, packages, index_packages, fail_fast=False):
     """Validate all packages in a registry, returning list of errors."""
     errors = []
 
     for native_id, package_versions in packages.items():
+        if fail_fast and errors:
+            break
+
         # Validate basic types
         if not isinstance(native_id, str):
             errors.append(
@@ -201,7 +264,17 @@ def validate_registry_packages(registry, packages, base_path, index_packages):
         # Validate versions
         errors.extend(validate_package_versions(native_id, registry, package_versions))
 
-        # Validate corresponding config exists
+    return errors
+
+
+def validate_registry_configs(registry, packages, base_path, fail_fast=False):
+    """Validate that every package in a registry has a config.json, returning list of errors."""
+    errors = []
+
+    for native_id in packages:
+        if fail_fast and errors:
+            break
+
         errors.extend(validate_config_exists(native_id, registry, base_path))
 
     return errors
@@ -227,8 +300,9 @@ def validate_package_versions(native_id, registry, package_versions):
     errors = []
 
     # Check for duplicate versions
-    if len(package_versions) != len(set(package_versions)):
-        duplicates = [v for v in set(package_versions) if package_versions.count(v) > 1]
+    version_counts = Counter(package_versions)
+    if len(version_counts) != len(package_versions):
+        duplicates = [v for v, count in version_counts.items() if count > 1]
         errors.append(
             f"Found duplicate versions for '{native_id}' in {registry}: {duplicates}"
         )
@@ -239,7 +313,7 @@ def validate_package_versions(native_id, registry, package_versions):
             errors.append(
                 f"Version '{version}' for '{native_id}' in {registry} must be a string"
             )
-        elif not re.match(VERSION_PATTERN, version):
+        elif not is_valid_version(version):
             errors.append(
                 f"Version '{version}' for '{native_id}' in {registry} must be in x.y.z or x.y format"
             )
@@ -247,20 +321,31 @@ def validate_package_versions(native_id, registry, package_versions):
     return errors
 
 
+def is_valid_version(version):
+    """Check a version string is in x.y or x.y.z format without using a regex."""
+    parts = version.split(".")
+    return 2 <= len(parts) <= 3 and all(part.isdecimal() for part in parts)
+
+
 def validate_config_exists(native_id, registry, base_path):
     """Validate that config.json exists for the package."""
     possible_restorations = get_possible_restorations(native_id, registry)
 
+    base_path = os.fspath(base_path)
     for restored_id in possible_restorations:
-        config_path = base_path / registry / restored_id / "config.json"
-        if config_path.exists():
+        # Rule out missing package directories from the cached listings first
+        package_dir = os.path.join(registry, restored_id)
+        if path_exists(base_path, package_dir) and os.path.isfile(
+            os.path.join(base_path, package_dir, "config.json")
+        ):
             return []
 
     return [
-        f"Missing config.json for '{native_id}' in {registry}. Tried restorations: {possible_restorations}"
+        f"Missing config.json for '{native_id}' in {registry}. Tried restorations: {list(possible_restorations)}"
     ]
 
 
+@lru_cache(maxsize=None)
 def get_possible_restorations(native_id, registry):
     """Get all possible restorations of a native identifier."""
     possibilities = []
@@ -279,6 +364,7 @@ def get_possible_restorations(native_id, registry):
     return deduplicate_list(possibilities)
 
 
+@lru_cache(maxsize=None)
 def get_npm_restorations(native_id):
     """Get possible restorations for npm packages."""
     possibilities = []
@@ -303,9 +389,10 @@ def get_npm_restorations(native_id):
 
     # Always try as-is
     possibilities.append(native_id)
-    return possibilities
+    return tuple(possibilities)
 
 
+@lru_cache(maxsize=None)
 def get_golang_restorations(native_id):
     """Get possible restorations for golang modules."""
     possibilities = []
@@ -324,29 +411,28 @@ def get_golang_restorations(native_id):
             possibilities.append(native_id.replace("_", "/"))
 
     possibilities.append(native_id)
-    return possibilities
+    return tuple(possibilities)
 
 
 def deduplicate_list(items):
-    """Remove duplicates from list while preserving order."""
+    """Remove duplicates from list while preserving order, returning a tuple."""
     seen = set()
     unique_items = []
     for item in items:
         if item not in seen:
             seen.add(item)
             unique_items.append(item)
-    return unique_items
+    return tuple(unique_items)
 
 
 def validate_file(file_path):
     """Validate a single file based on its type."""
-    if not os.path.exists(file_path):
-        return False, f"File '{file_path}' not found"
-
+    # Read raw bytes; the JSON parser decodes UTF-8 itself
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
-    except Exception as e:
+        content = Path(file_path).read_bytes()
+    except FileNotFoundError:
+        return False, f"File '{file_path}' not found"
+    except OSError as e:
         return False, f"Error reading file: {e}"
 
     # Determine validation based on filename
@@ -360,17 +446,25 @@ def validate_file(file_path):
     if file_name not in validators:
         return True, f"Unknown file type '{file_name}', skipping validation"
 
+    # Empty or whitespace-only files can never be valid, skip the parser
+    if not content.strip():
+        return False, "Empty file"
+
     return validators[file_name](file_path, content)
 
 
 def find_all_validation_files(root_path):
     """Find all config.json, index.json, and versions.json files in the repository."""
-    root = Path(root_path)
     files_to_validate = []
 
-    # Find all JSON files that we validate
-    for pattern in ["**/config.json", "**/index.json", "**/versions.json"]:
-        files_to_validate.extend(root.glob(pattern))
-
-    # Convert to strings and sort for consistent output
-    return sorted([str(f) for f in files_to_validate])
+    # Single walk over the tree, pruning directories that never hold
+    # validation files before descending into them
+    for dir_path, dir_names, file_names in os.walk(root_path):
+        dir_names[:] = [d for d in dir_names if d not in SKIPPED_DIRECTORIES]
+        for file_name in file_names:
+            if file_name in VALIDATION_FILE_NAMES:
+                files_to_validate.append(os.path.join(dir_path, file_name))
+
+    # Sort in place for consistent output
+    files_to_validate.sort()
+    return files_to_validate
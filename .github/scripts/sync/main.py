@@ -1,13 +1,20 @@
 import concurrent.futures
-import json
+import math
 import os
-import re
+import random
 import sys
-import time
+import threading
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, NamedTuple, Set, Tuple, Optional
+from urllib.parse import urlparse
+import orjson
 import requests
-from chromadb import CloudClient, Collection
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from chromadb import CloudClient
 from packaging import version
 
 # Import logger and retry utils from common module
@@ -27,30 +34,109 @@ DATABASES = [
     "ruby_gems",
 ]
 
+REQUIRED_ENV_VARS = (
+    "CHROMA_TENANT_UUID",
+    "CHROMA_TEAM_ID",
+    "CHROMA_API_KEY",
+    "CHROMA_API_URL",
+    "CHROMA_BACKEND_URL",
+)
+
 MAX_CONCURRENT_DASHBOARD_BACKEND_WRITES = 50
 MAX_RETRIES_MARK_PUBLIC = 3
 BASE_RETRY_DELAY = 1.0
+# (connect, read) timeouts in seconds for dashboard backend requests
+DASHBOARD_BACKEND_TIMEOUT = (5, 30)
 VERSIONS_JSON_PATH = "../../../versions.json"
+# IDs of collections already marked public, persisted between runs by the workflow cache
+PUBLIC_MARKED_PATH = "public_marked.json"
+
+
+class JitteredRetry(Retry):
+    """
+    Retry with full jitter from the first retry on. urllib3 skips the delay
+    before the first retry, so concurrent workers hitting the same transient
+    failure would otherwise all re-send at once. A Retry-After header still
+    takes precedence, since urllib3 only falls back to this when it is absent.
+    """
+
+    def get_backoff_time(self) -> float:
+        consecutive_errors = 0
+        for entry in reversed(self.history):
+            if entry.redirect_location is not None:
+                break
+            consecutive_errors += 1
+        if consecutive_errors == 0:
+            return 0
+        return random.uniform(
+            0,
+            min(self.backoff_max, self.backoff_factor * 2 ** (consecutive_errors - 1)),
+        )
+
+
+# Shared session so concurrent writers reuse keep-alive connections to the
+# dashboard backend instead of opening a new TCP+TLS connection per request.
+# Transient server errors are retried with jittered exponential backoff by urllib3.
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=MAX_CONCURRENT_DASHBOARD_BACKEND_WRITES,
+    pool_maxsize=MAX_CONCURRENT_DASHBOARD_BACKEND_WRITES,
+    max_retries=JitteredRetry(
+        total=MAX_RETRIES_MARK_PUBLIC - 1,
+        backoff_factor=BASE_RETRY_DELAY,
+        # Other 4xx responses are permanent, retrying them only wastes time
+        status_forcelist=[408, 429, 500, 502, 503, 504],
+        respect_retry_after_header=True,
+        allowed_methods=["POST"],
+        raise_on_status=False,
+    ),
+)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+SESSION.headers["Content-Type"] = "application/json"
+
+# Set once the dashboard backend rejects our credentials. Marking starts while
+# other databases are still listing, so queued requests check this instead of
+# waiting for the main loop to notice the failure.
+AUTH_FAILED = threading.Event()
 
 
 class SyncError(Exception):
     pass
 
 
+class CollectionRef(NamedTuple):
+    """The parts of a finished collection the sync needs once listing is done"""
+
+    name: str
+    id: str
+
+
+class FatalAuthError(SyncError):
+    """The dashboard backend rejected our credentials, so every further request will fail too."""
+
+
+class SkippedAfterAuthFailure(SyncError):
+    """A mark-public request that was never sent because credentials were already rejected."""
+
+
 def initialize_clients(
     chroma_api_url: str, chroma_tenant_uuid: str, chroma_api_key: str
 ) -> Dict[str, CloudClient]:
+    # Accept the API URL with or without a scheme or trailing slash
+    cloud_host = urlparse(chroma_api_url).netloc or chroma_api_url.rstrip("/")
     clients = {}
     for database in DATABASES:
         try:
             clients[database] = CloudClient(
-                cloud_host=chroma_api_url.split("https://")[1],
+                cloud_host=cloud_host,
                 tenant=chroma_tenant_uuid,
                 database=database,
                 api_key=chroma_api_key,
             )
         except Exception as e:
-            logger.error(
+            # Every database shares the same credentials, so don't bother with the rest
+            raise SyncError(
                 f"Failed to initialize client for database '{database}': {str(e)}"
             )
     return clients
@@ -72,130 +158,205 @@ def get_collection_counts(clients: Dict[str, CloudClient]) -> Dict[str, int]:
 
 
 def list_collections_for_database(
-    database: str, client: CloudClient
-) -> Tuple[str, List[str], Optional[str]]:
+    database: str,
+    client: CloudClient,
+    expected_count: int,
+    page_executor: concurrent.futures.Executor,
+) -> Tuple[str, List[CollectionRef], int, Optional[str]]:
+    """
+    List every collection in a database, returning the ones that have
+    finished ingesting along with the total number of collections listed.
+    Listed collections already carry their metadata, so no per-collection
+    fetch is needed to check finished_ingest. Only the name and id of each
+    finished collection are kept so the full models can be freed.
+
+    Pages covering expected_count are fetched concurrently on page_executor,
+    which bounds the number of in-flight Chroma reads across all databases.
+    """
     try:
-        all_collection_names: List[str] = []
-        offset = 0
         limit = 100
 
         # Create a retry-wrapped version of list_collections
         @retry_with_exponential_backoff(max_retries=3, base_delay=1.0, logger=logger)
-        def _list_collections_with_retry(limit: int, offset: int):
+        def _list_collections_with_retry(offset: int):
             return client.list_collections(limit=limit, offset=offset)
 
-        # Get all collections in batches
-        while True:
-            collections_page = _list_collections_with_retry(limit=limit, offset=offset)
-            if not collections_page:
-                break
-            all_collection_names.extend([coll.name for coll in collections_page])
-            offset += limit
-
-        return database, all_collection_names, None
-    except Exception as e:
-        return database, [], str(e)
+        # Fetch the pages covering the known count in parallel, map keeps page order
+        num_pages = math.ceil(expected_count / limit)
+        pages = list(
+            page_executor.map(
+                _list_collections_with_retry, range(0, num_pages * limit, limit)
+            )
+        )
 
+        # Collections created after counting land past the planned pages, so
+        # keep paging until a short page shows there is nothing left
+        offset = num_pages * limit
+        while not pages or len(pages[-1]) == limit:
+            pages.append(
+                page_executor.submit(_list_collections_with_retry, offset).result()
+            )
+            offset += limit
 
-def get_collection_metadata(
-    database: str, collection_name: str, client: CloudClient
-) -> Tuple[str, str, Optional[Collection], Optional[str]]:
-    try:
-        # Create a retry-wrapped version of get_collection
-        @retry_with_exponential_backoff(max_retries=3, base_delay=1.0, logger=logger)
-        def _get_collection_with_retry(name: str):
-            return client.get_collection(name=name)
+        finished_collections = [
+            CollectionRef(coll.name, str(coll.id))
+            for collections_page in pages
+            for coll in collections_page
+            if coll.metadata and coll.metadata.get("finished_ingest") is True
+        ]
+        listed_count = sum(len(collections_page) for collections_page in pages)
 
-        full_collection = _get_collection_with_retry(name=collection_name)
-        if (
-            full_collection.metadata
-            and full_collection.metadata.get("finished_ingest") is True
-        ):
-            return database, collection_name, full_collection, None
-        return database, collection_name, None, None
+        return database, finished_collections, listed_count, None
     except Exception as e:
-        return database, collection_name, None, str(e)
+        return database, [], 0, str(e)
 
 
 def parse_collection_name(collection_name: str) -> Tuple[Optional[str], Optional[str]]:
-    pattern = re.compile(r"^(.*)_([^_]*)$")
-    match = pattern.match(collection_name)
-    if match:
-        prefix, version_str = match.groups()
-        return prefix, version_str
-    return None, None
+    # The version is everything after the last underscore, the prefix everything before it
+    index = collection_name.rfind("_")
+    if index <= 0 or index == len(collection_name) - 1:
+        return None, None
+    return collection_name[:index], collection_name[index + 1 :]
 
 
 def mark_collection_public(
-    collection: Collection,
+    collection: CollectionRef,
     chroma_backend_url: str,
     chroma_team_id: str,
     database: str,
-    chroma_api_key: str,
 ) -> Tuple[bool, Optional[str]]:
+    if AUTH_FAILED.is_set():
+        raise SkippedAfterAuthFailure(
+            f"Skipped marking collection {collection.name} public after the dashboard backend rejected credentials"
+        )
+
     url = f"{chroma_backend_url}/api/v1/public-collections"
-    headers = {"x-api-key": chroma_api_key}
     payload = {
         "teamId": chroma_team_id,
         "teamStaticName": "chroma",
         "databaseName": database,
         "collectionName": collection.name,
-        "dataPlaneCollectionId": str(collection.id),
+        "dataPlaneCollectionId": collection.id,
     }
 
-    for attempt in range(MAX_RETRIES_MARK_PUBLIC):
-        try:
-            response = requests.post(url=url, headers=headers, json=payload)
-
-            if response.status_code == 409:
-                # Collection is already public, this is fine
-                return True, None
-            elif response.status_code == 200 or response.status_code == 201:
-                # Successfully marked as public
-                return True, None
-            else:
-                # Other error, we'll retry
-                if attempt == MAX_RETRIES_MARK_PUBLIC - 1:
-                    return (
-                        False,
-                        f"Failed to mark collection {collection.name} as public: HTTP {response.status_code} - {response.text}",
-                    )
+    try:
+        response = SESSION.post(
+            url, data=orjson.dumps(payload), timeout=DASHBOARD_BACKEND_TIMEOUT
+        )
+    except Exception as e:
+        return (
+            False,
+            f"Failed to mark collection {collection.name} as public: {str(e)}",
+        )
 
-                # Exponential backoff
-                delay = BASE_RETRY_DELAY * (2**attempt)
-                time.sleep(delay)
+    # 409 means the collection is already public, which is fine
+    if response.status_code in (200, 201, 409):
+        return True, None
 
-        except Exception as e:
-            if attempt == MAX_RETRIES_MARK_PUBLIC - 1:
-                return (
-                    False,
-                    f"Failed to mark collection {collection.name} as public: {str(e)}",
-                )
-
-            # Exponential backoff
-            delay = BASE_RETRY_DELAY * (2**attempt)
-            time.sleep(delay)
+    if response.status_code in (401, 403):
+        AUTH_FAILED.set()
+        raise FatalAuthError(
+            f"Dashboard backend rejected credentials: HTTP {response.status_code} - {response.text}"
+        )
 
     return (
         False,
-        f"Failed to mark collection {collection.name} as public after {MAX_RETRIES_MARK_PUBLIC} attempts",
+        f"Failed to mark collection {collection.name} as public: HTTP {response.status_code} - {response.text}",
     )
 
 
-def save_versions_json(versions_data: Dict) -> None:
+def collect_marked_public(
+    future_to_collection: Dict[concurrent.futures.Future, Tuple[CollectionRef, str]],
+    public_marked: Set[str],
+) -> None:
+    """
+    Add every collection whose mark-public request has already finished
+    successfully to public_marked, so an aborted run keeps its progress.
+    """
+    for future, (collection, _) in future_to_collection.items():
+        if (
+            future.done()
+            and not future.cancelled()
+            and future.exception() is None
+            and future.result()[0]
+        ):
+            public_marked.add(collection.id)
+
+
+def write_file_atomically(path: str, data: bytes) -> None:
+    """
+    Write data to path via a temporary file and os.replace, so readers and
+    interrupted runs only ever see the old or the new contents, never a
+    truncated file.
+    """
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        # Don't leave a stray temporary file next to the target
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def load_public_marked() -> Set[str]:
+    """
+    Load the IDs of collections marked public by previous runs.
+    A missing or unreadable file just means every collection gets marked again.
+    """
+    try:
+        with open(PUBLIC_MARKED_PATH, "rb") as f:
+            return set(orjson.loads(f.read()))
+    except FileNotFoundError:
+        return set()
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable {PUBLIC_MARKED_PATH}: {str(e)}")
+        return set()
+
+
+def save_public_marked(public_marked: Set[str]) -> None:
+    """
+    Persist the IDs of collections marked public. The file is only an
+    optimization, so a failed write is logged rather than failing the sync.
+    """
+    try:
+        write_file_atomically(PUBLIC_MARKED_PATH, orjson.dumps(sorted(public_marked)))
+    except Exception as e:
+        logger.warning(f"Failed to save {PUBLIC_MARKED_PATH}: {str(e)}")
+
+
+def save_versions_json(versions_data: Dict) -> bool:
     """
     Completely overwrites versions.json with the provided data.
-    Uses sort_keys to ensure consistent ordering.
+    The data is expected to already be in sorted order, see
+    build_versions_data_from_collections, so keys are written as-is.
+    Returns False without touching the file if its contents would not change.
     """
     try:
-        with open(VERSIONS_JSON_PATH, "w") as f:
-            json.dump(versions_data, f, indent=2, sort_keys=True)
+        new_content = orjson.dumps(versions_data, option=orjson.OPT_INDENT_2)
+        try:
+            if Path(VERSIONS_JSON_PATH).read_bytes() == new_content:
+                return False
+        except FileNotFoundError:
+            pass
+        write_file_atomically(VERSIONS_JSON_PATH, new_content)
+        return True
     except Exception as e:
         raise SyncError(f"Failed to save versions.json: {str(e)}")
 
 
+@lru_cache(maxsize=None)
+def parse_version(version_str: str) -> version.Version:
+    # Version strings repeat across prefixes and databases, parse each one once
+    return version.parse(version_str)
+
+
 def build_versions_data_from_collections(
-    all_finished_collections: Dict[str, List[Collection]],
+    all_finished_collections: Dict[str, List[CollectionRef]],
 ) -> Dict:
     """
     Build the complete versions.json data structure from scratch based on
@@ -212,29 +373,26 @@ def build_versions_data_from_collections(
         # Always add the database to versions_data, even if empty
         versions_data["versions"][database] = {}
 
-        # Group collections by prefix
-        grouped_by_prefix = {}
+        parsed_names: List[Tuple[str, str]] = []
         for collection in collections:
             prefix, version_str = parse_collection_name(collection.name)
             if prefix and version_str:
-                if prefix not in grouped_by_prefix:
-                    grouped_by_prefix[prefix] = []
-                grouped_by_prefix[prefix].append(version_str)
+                parsed_names.append((prefix, version_str))
             else:
                 logger.warning(
                     f"Could not parse collection name '{collection.name}' in database '{database}'"
                 )
 
-        # Sort prefixes alphabetically for consistent ordering
-        sorted_prefixes = sorted(grouped_by_prefix.keys())
+        # Sort by prefix once so groupby yields prefixes in alphabetical order
+        parsed_names.sort(key=itemgetter(0))
 
         # Sort versions for each prefix
-        for prefix in sorted_prefixes:
-            version_strings = grouped_by_prefix[prefix]
+        for prefix, group in groupby(parsed_names, key=itemgetter(0)):
+            version_strings = [version_str for _, version_str in group]
             try:
                 # Sort versions in descending order using the 'packaging' library
                 sorted_versions = sorted(
-                    version_strings, key=version.parse, reverse=True
+                    version_strings, key=parse_version, reverse=True
                 )
                 versions_data["versions"][database][prefix] = sorted_versions
             except Exception as e:
@@ -255,58 +413,38 @@ def main():
     logger.info("Initializing sync job")
 
     # Get environment variables
-    chroma_tenant_uuid = os.getenv("CHROMA_TENANT_UUID")
-    chroma_team_id = os.getenv("CHROMA_TEAM_ID")
-    chroma_api_key = os.getenv("CHROMA_API_KEY")
-    chroma_api_url = os.getenv("CHROMA_API_URL")
-    chroma_backend_url = os.getenv("CHROMA_BACKEND_URL")
-
-    if not chroma_tenant_uuid:
-        logger.critical("The CHROMA_TENANT_UUID environment variable was not found")
-        logger.error(
-            "Please ensure you have created the secret in your repository settings"
-        )
-        sys.exit(1)
-
-    if not chroma_team_id:
-        logger.critical("The CHROMA_TEAM_ID environment variable was not found")
-        logger.error(
-            "Please ensure you have created the secret in your repository settings"
-        )
-        sys.exit(1)
-
-    if not chroma_api_key:
-        logger.critical("The CHROMA_API_KEY environment variable was not found")
-        logger.error(
-            "Please ensure you have created the secret in your repository settings"
-        )
-        sys.exit(1)
-
-    if not chroma_api_url:
-        logger.critical("The CHROMA_API_URL environment variable was not found")
-        logger.error(
-            "Please ensure you have created the secret in your repository settings"
-        )
-        sys.exit(1)
+    env = {}
+    for name in REQUIRED_ENV_VARS:
+        value = os.getenv(name)
+        if not value:
+            logger.critical(f"The {name} environment variable was not found")
+            logger.error(
+                "Please ensure you have created the secret in your repository settings"
+            )
+            sys.exit(1)
+        env[name] = value
 
-    if not chroma_backend_url:
-        logger.critical("The CHROMA_BACKEND_URL environment variable was not found")
-        logger.error(
-            "Please ensure you have created the secret in your repository settings"
-        )
-        sys.exit(1)
+    chroma_tenant_uuid = env["CHROMA_TENANT_UUID"]
+    chroma_team_id = env["CHROMA_TEAM_ID"]
+    chroma_api_key = env["CHROMA_API_KEY"]
+    chroma_api_url = env["CHROMA_API_URL"]
+    chroma_backend_url = env["CHROMA_BACKEND_URL"]
 
     logger.success("Successfully accessed required environment variables")
 
+    # Authenticate every dashboard backend request made through the shared session
+    SESSION.headers["x-api-key"] = chroma_api_key
+
     max_concurrent_chroma_reads = 3 if "devchroma" in chroma_api_url else 8
 
     # Initialize chroma clients for all databases
     logger.subsection("Initializing Clients")
     logger.info("Initializing chroma clients for all databases")
 
-    clients = initialize_clients(chroma_api_url, chroma_tenant_uuid, chroma_api_key)
-    if len(clients) != len(DATABASES):
-        logger.critical("Failed to initialize clients for all databases")
+    try:
+        clients = initialize_clients(chroma_api_url, chroma_tenant_uuid, chroma_api_key)
+    except SyncError as e:
+        logger.critical(str(e))
         sys.exit(1)
 
     logger.success(f"Successfully initialized clients for {len(clients)} databases")
@@ -321,15 +459,37 @@ def main():
     logger.subsection("Listing Collections")
     logger.info("Listing all collections with global parallelism")
 
-    db_to_collections = {}
+    # Initialize all_finished_collections with all databases to ensure they're all included
+    all_finished_collections = {db: [] for db in DATABASES}
     list_errors = []
 
+    # Collections marked public by earlier runs don't need another request
+    public_marked = load_public_marked()
+    already_public_count = 0
+
+    # Marking starts as soon as a database has been listed, so dashboard backend
+    # writes overlap with listing the remaining databases
+    marker_executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=MAX_CONCURRENT_DASHBOARD_BACKEND_WRITES
+    )
+    future_to_collection = {}
+
+    # Per-database tasks only coordinate their pages, the page executor is
+    # what bounds concurrent reads against Chroma
     with concurrent.futures.ThreadPoolExecutor(
         max_workers=max_concurrent_chroma_reads
+    ) as page_executor, concurrent.futures.ThreadPoolExecutor(
+        max_workers=len(clients)
     ) as executor:
         # Submit list_collections tasks for all databases
         future_to_db = {
-            executor.submit(list_collections_for_database, db, client): db
+            executor.submit(
+                list_collections_for_database,
+                db,
+                client,
+                collection_counts[db],
+                page_executor,
+            ): db
             for db, client in clients.items()
         }
 
@@ -337,79 +497,39 @@ def main():
             db_name = future_to_db[future]
             logger.progress(i, len(DATABASES), f"Listing collections for {db_name}")
 
-            db_name, collection_names, error = future.result()
+            db_name, finished_collections, listed_count, error = future.result()
             if error:
                 error_msg = f"Error listing collections for '{db_name}': {error}"
                 logger.error(error_msg)
                 list_errors.append(error_msg)
             else:
-                db_to_collections[db_name] = collection_names
-                logger.success(
-                    f"Listed {len(collection_names)} collections in '{db_name}'"
-                )
+                all_finished_collections[db_name] = finished_collections
+                logger.success(f"Listed {listed_count} collections in '{db_name}'")
+
+                for collection in finished_collections:
+                    if collection.id in public_marked:
+                        already_public_count += 1
+                        continue
+                    marker_future = marker_executor.submit(
+                        mark_collection_public,
+                        collection,
+                        chroma_backend_url,
+                        chroma_team_id,
+                        db_name,
+                    )
+                    future_to_collection[marker_future] = (collection, db_name)
 
     if list_errors:
+        # Let in-flight requests finish and record the ones that succeeded so
+        # the next run doesn't post them again
+        marker_executor.shutdown(cancel_futures=True)
+        collect_marked_public(future_to_collection, public_marked)
+        save_public_marked(public_marked)
         logger.critical("Errors occurred while listing collections")
         for error in list_errors:
             logger.error(error)
         sys.exit(1)
 
-    # Check metadata globally in parallel
-    logger.subsection("Checking Metadata")
-    logger.info("Checking collection metadata with global parallelism")
-
-    # Create list of (database, collection_name, client) tuples for global processing
-    metadata_tasks = []
-    for db_name, collection_names in db_to_collections.items():
-        client = clients[db_name]
-        for collection_name in collection_names:
-            metadata_tasks.append((db_name, collection_name, client))
-
-    total_metadata_checks = len(metadata_tasks)
-    logger.info(f"Checking metadata for {total_metadata_checks} collections")
-
-    # Initialize all_finished_collections with all databases to ensure they're all included
-    all_finished_collections = {db: [] for db in DATABASES}
-    metadata_errors = []
-    processed_metadata = 0
-
-    with concurrent.futures.ThreadPoolExecutor(
-        max_workers=max_concurrent_chroma_reads
-    ) as executor:
-        # Submit metadata check tasks globally
-        future_to_task = {
-            executor.submit(
-                get_collection_metadata, db_name, collection_name, client
-            ): (db_name, collection_name)
-            for db_name, collection_name, client in metadata_tasks
-        }
-
-        for future in concurrent.futures.as_completed(future_to_task):
-            db_name, collection_name = future_to_task[future]
-            processed_metadata += 1
-            logger.progress(
-                processed_metadata,
-                total_metadata_checks,
-                f"Checking {collection_name} in {db_name}",
-            )
-
-            db_name, collection_name, collection, error = future.result()
-            if error:
-                metadata_errors.append(
-                    f"Error checking metadata for '{collection_name}' in '{db_name}': {error}"
-                )
-            elif collection:  # Collection has finished_ingest = true
-                all_finished_collections[db_name].append(collection)
-
-    if metadata_errors:
-        logger.warning(
-            f"Encountered {len(metadata_errors)} metadata check errors (continuing anyway)"
-        )
-        for error in metadata_errors[:10]:
-            logger.warning(error)
-        if len(metadata_errors) > 10:
-            logger.warning(f"... and {len(metadata_errors) - 10} more errors")
-
     # Summary of found collections
     total_finished = sum(
         len(collections) for collections in all_finished_collections.values()
@@ -428,16 +548,13 @@ def main():
         f"Built versions data with {len(versions_data['versions'])} databases"
     )
 
-    # Mark collections as public with global concurrent processing
+    # Wait for the marking tasks submitted while listing
     logger.subsection("Marking Collections Public")
 
-    # Create a list of (collection, database) tuples for global processing
-    collections_to_mark = []
-    for database, collections in all_finished_collections.items():
-        for collection in collections:
-            collections_to_mark.append((collection, database))
-
-    total_collections = len(collections_to_mark)
+    total_collections = len(future_to_collection)
+    logger.info(
+        f"Skipping {already_public_count} collections already marked public by previous runs"
+    )
     logger.info(
         f"Marking {total_collections} collections as public with global parallelism"
     )
@@ -445,22 +562,7 @@ def main():
     public_marking_errors = []
     processed_count = 0
 
-    with concurrent.futures.ThreadPoolExecutor(
-        max_workers=MAX_CONCURRENT_DASHBOARD_BACKEND_WRITES
-    ) as executor:
-        # Submit all marking tasks globally
-        future_to_collection = {
-            executor.submit(
-                mark_collection_public,
-                collection,
-                chroma_backend_url,
-                chroma_team_id,
-                database,
-                chroma_api_key,
-            ): (collection, database)
-            for collection, database in collections_to_mark
-        }
-
+    with marker_executor:
         for future in concurrent.futures.as_completed(future_to_collection):
             collection, database = future_to_collection[future]
             processed_count += 1
@@ -470,11 +572,27 @@ def main():
                 f"Marking {collection.name} public in {database}",
             )
 
-            success, error = future.result()
-            if not success:
+            try:
+                success, error = future.result()
+            except SkippedAfterAuthFailure:
+                # The request that was actually rejected is reported below
+                continue
+            except FatalAuthError as e:
+                # Don't burn through the remaining requests with a bad API key
+                marker_executor.shutdown(wait=False, cancel_futures=True)
+                collect_marked_public(future_to_collection, public_marked)
+                save_public_marked(public_marked)
+                logger.critical(str(e))
+                sys.exit(1)
+            if success:
+                public_marked.add(collection.id)
+            else:
                 public_marking_errors.append(error)
                 logger.error(f"Error marking collection as public: {error}")
 
+    # Persist progress before checking errors so a failed run doesn't redo finished work
+    save_public_marked(public_marked)
+
     # Check for public marking errors
     if public_marking_errors:
         logger.critical("Errors occurred while marking collections as public")
@@ -487,20 +605,18 @@ def main():
     logger.info("Overwriting versions.json with complete data")
 
     try:
-        save_versions_json(versions_data)
-        logger.success("Successfully overwrote versions.json")
+        if save_versions_json(versions_data):
+            logger.success("Successfully overwrote versions.json")
+        else:
+            logger.success("versions.json is already up to date")
     except SyncError as e:
         logger.critical(str(e))
         sys.exit(1)
 
     # Summary
-    total_collections = sum(
-        len(collections) for collections in all_finished_collections.values()
-    )
-
     logger.section("SYNC COMPLETION")
     logger.success("Sync job completed successfully!")
-    logger.info(f"Total collections processed: {total_collections}")
+    logger.info(f"Total collections processed: {total_finished}")
     logger.info(f"Databases processed: {len(all_finished_collections)}")
 
     # Print per-database summary
@@ -512,4 +628,7 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    try:
+        main()
+    finally:
+        SESSION.close()
@@ -1,5 +1,7 @@
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 # Import validation utilities from common module
@@ -8,8 +10,14 @@ from validation_utils import validate_file
 from logger import logger
 
 
+@lru_cache(maxsize=8)
 def find_repo_root(start_path=None):
     """Find the repository root by looking for .git directory."""
+    # GitHub Actions checks the repository out into the workspace directory
+    github_workspace = os.environ.get("GITHUB_WORKSPACE")
+    if start_path is None and github_workspace:
+        return Path(github_workspace).resolve()
+
     current = Path(start_path or __file__).resolve()
 
     while current != current.parent:
@@ -61,17 +69,25 @@ def main(file_paths):
 
     logger.info(f"Found {len(resolved_paths)} file(s) to validate")
 
-    for i, file_path in enumerate(resolved_paths, 1):
-        logger.progress(i, len(resolved_paths), os.path.basename(file_path))
-
-        is_valid, message = validate_file(file_path)
-
-        if is_valid:
-            logger.file_status(file_path, "valid", message)
-        else:
-            logger.file_status(file_path, "invalid", message)
-            all_files_valid = False
-            failed_files.append(file_path)
+    # Files are independent and a PR usually touches only a few, so threads
+    # overlap the reads without paying process startup.
+    # map() keeps results in input order so the output stays deterministic.
+    max_workers = min(len(resolved_paths), (os.cpu_count() or 1) * 4) or 1
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(validate_file, resolved_paths)
+
+        for i, (file_path, (is_valid, message)) in enumerate(
+            zip(resolved_paths, results), 1
+        ):
+            logger.progress(i, len(resolved_paths), os.path.basename(file_path))
+
+            if is_valid:
+                logger.file_status(file_path, "valid", message)
+            else:
+                logger.file_status(file_path, "invalid", message)
+                all_files_valid = False
+                failed_files.append(file_path)
 
     # Print summary
     passed_count = len(resolved_paths) - len(failed_files)